@@ -148,7 +148,8 @@ def run_watch_mode(pipeline: Pipeline, source_dir: str) -> int:
             'wait_delay_seconds': 10,
             'max_move_attempts': 3,
             'retry_delay_seconds': 3,
-            'recursive': False
+            'recursive': False,
+            'max_workers': pipeline.config.get('processing', {}).get('file_workers', 1)
         }
         
         watcher = FileWatcher(pipeline, watch_config)
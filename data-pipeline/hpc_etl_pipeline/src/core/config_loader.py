@@ -12,6 +12,9 @@ class ConfigLoader:
     DEFAULT_CONFIG = {
         "processing": {
             "max_workers": 4,
+            "file_workers": 1,
+            "disk_gb_per_worker": 30,
+            "memory_gb_per_worker": 8,
             "batch_size": 500000,
             "memory_limit_gb": 80,
             "temp_directory": "./temp"
@@ -19,6 +22,7 @@ class ConfigLoader:
         "output": {
             "format": "parquet",
             "compression": "snappy",
+            "value_dtype": "float64",
             "chunking": {
                 "enabled": True,
                 "max_size_gb": 2.0,
@@ -101,6 +105,15 @@ class ConfigLoader:
         if 'type' not in source:
             raise ConfigurationError("Missing 'type' in source configuration")
         
+        # Validate output section. The loader only special-cases float32, so
+        # a typo would otherwise be written silently as float64
+        value_dtype = config['output'].get('value_dtype', 'float64')
+        valid_value_dtypes = ['float64', 'float32']
+        if value_dtype not in valid_value_dtypes:
+            raise ConfigurationError(
+                f"Invalid output value_dtype '{value_dtype}'. Must be one of: {valid_value_dtypes}"
+            )
+        
         # Validate transformations if present
         if 'transformations' in config:
             for i, transform in enumerate(config['transformations']):
@@ -1,20 +1,26 @@
 """Main pipeline orchestrator for HPC ETL processing."""
 
-import gc
+import os
+import shutil
 import logging
+import logging.handlers
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 import polars as pl
 
 from .config_loader import ConfigLoader
 from .exceptions import HpcEtlException, ConfigurationError
+from ..extractors.base_extractor import find_matching_files
 from ..extractors.http_extractor import HttpExtractor
 from ..extractors.local_extractor import LocalExtractor
 from ..extractors.globus_extractor import GlobusExtractor
 from ..transformers.hpc_transformers import BlockIOTransformer, CPUTransformer, MemoryTransformer, NFSTransformer
 from ..transformers.generic_transformers import CompositeTransformer
 from ..loaders.parquet_loader import ParquetLoader
+from ..utils.file_cache import drop_page_cache
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +48,7 @@ class Pipeline:
         Args:
             config_path: Path to the configuration file
         """
+        self.config_path = config_path
         self.config_loader = ConfigLoader()
         self.config = self.config_loader.load_dataset_config(config_path)
         
@@ -92,14 +99,23 @@ class Pipeline:
         try:
             logger.info(f"Processing file: {file_path_obj}")
             
-            # Read the file
-            data = self._read_file(file_path_obj)
+            # Read only the columns the transformations use, with the dtypes
+            # the HPC transformer expects, if any. Without one, the generic
+            # transformations keep just the output schema columns
+            hpc_transformer = self._get_hpc_transformer(file_path_obj)
+            if hpc_transformer:
+                schema_overrides = hpc_transformer.INPUT_SCHEMA
+                columns = list(schema_overrides)
+            else:
+                schema_overrides = None
+                columns = self.generic_transformer.get_expected_columns() or None
+            
+            data = self._read_file(file_path_obj, schema_overrides, columns)
             if data.is_empty():
                 logger.warning(f"No data to process in {file_path_obj}")
                 return False
             
             # Apply HPC-specific transformation if applicable
-            hpc_transformer = self._get_hpc_transformer(file_path_obj)
             if hpc_transformer:
                 logger.info(f"Applying HPC-specific transformation: {hpc_transformer.__class__.__name__}")
                 data = hpc_transformer.transform(data)
@@ -131,15 +147,13 @@ class Pipeline:
                 self.failed_files += 1
                 logger.error(f"Failed to save processed data for {file_path_obj}")
             
-            # Clean up memory
-            del data
-            gc.collect()
-            
             return success
             
         except Exception as e:
             self.failed_files += 1
             logger.error(f"Error processing file {file_path_obj}: {e}")
+            # Only formatted when DEBUG logging is enabled
+            logger.debug("Traceback:", exc_info=True)
             return False
     
     def process_folder(self, folder_path: str) -> Dict[str, int]:
@@ -161,13 +175,9 @@ class Pipeline:
         
         # Get file patterns from configuration
         file_patterns = self.config['source'].get('file_patterns', ['*'])
-        processed_count = 0
+        file_paths = find_matching_files(folder_path_obj, file_patterns)
         
-        for pattern in file_patterns:
-            for file_path in folder_path_obj.glob(pattern):
-                if file_path.is_file():
-                    if self.process_file(str(file_path)):
-                        processed_count += 1
+        processed_count = self.process_files(file_paths)
         
         return {
             'processed': processed_count,
@@ -175,6 +185,151 @@ class Pipeline:
             'total': self.processed_files + self.failed_files
         }
     
+    def process_files(self, file_paths: List[Path]) -> int:
+        """
+        Process independent files, in parallel when the configuration allows it.
+        
+        Args:
+            file_paths: Paths of the files to process
+            
+        Returns:
+            Number of files processed successfully
+        """
+        # Empty files have nothing to transform, so they never need a worker
+        file_paths = [file_path for file_path in file_paths if not self._is_empty_file(file_path)]
+        
+        # A single file never needs the pool or the disk and memory checks
+        num_workers = min(self.get_file_workers(), len(file_paths)) if len(file_paths) > 1 else 1
+        
+        if num_workers <= 1:
+            return sum(1 for file_path in file_paths if self.process_file(str(file_path)))
+        
+        logger.info(f"Processing {len(file_paths)} files with {num_workers} worker processes")
+        processed_count = 0
+        
+        # spawn starts every worker as a fresh interpreter: nothing is forked
+        # from a process that already runs Polars threads, and each pool's
+        # workers see the environment as it is when they start, which a
+        # long-lived forkserver would not
+        context = multiprocessing.get_context('spawn')
+        
+        # Workers send their log records back over a queue so they reach the
+        # same handlers (console, --log-file) as the parent's own records
+        root_logger = logging.getLogger()
+        log_queue = context.Queue()
+        log_listener = logging.handlers.QueueListener(log_queue, *root_logger.handlers,
+                                                      respect_handler_level=True)
+        log_listener.start()
+        
+        # Each worker starts its own Polars thread pool, sized to every core by
+        # default. Split the cores between the workers instead of running
+        # num_workers full-size pools against each other. Polars reads the
+        # setting on import, before any initializer runs, so it is placed in
+        # the environment the workers start with and removed once the pool is
+        # gone. An explicit POLARS_MAX_THREADS setting is left alone
+        set_polars_threads = 'POLARS_MAX_THREADS' not in os.environ
+        if set_polars_threads:
+            os.environ['POLARS_MAX_THREADS'] = str(max(1, (os.cpu_count() or 1) // num_workers))
+        
+        try:
+            with ProcessPoolExecutor(max_workers=num_workers,
+                                     mp_context=context,
+                                     initializer=_init_worker,
+                                     initargs=(self.config_path, root_logger.level, log_queue)) as executor:
+                future_to_path = {
+                    executor.submit(_process_file_in_worker, str(file_path)): file_path
+                    for file_path in file_paths
+                }
+                
+                for future in as_completed(future_to_path):
+                    file_path = future_to_path[future]
+                    try:
+                        success, processed_delta, failed_delta = future.result()
+                    except Exception as e:
+                        logger.error(f"Worker failed while processing {file_path}: {e}")
+                        logger.debug("Traceback:", exc_info=True)
+                        self.failed_files += 1
+                        continue
+                    
+                    self.processed_files += processed_delta
+                    self.failed_files += failed_delta
+                    if success:
+                        processed_count += 1
+        finally:
+            # The pool has shut down, so every worker record is already queued
+            log_listener.stop()
+            if set_polars_threads:
+                del os.environ['POLARS_MAX_THREADS']
+        
+        return processed_count
+    
+    def _is_empty_file(self, file_path: Path) -> bool:
+        """Check whether a file exists but holds no data."""
+        try:
+            if Path(file_path).stat().st_size == 0:
+                logger.warning(f"No data to process in {file_path}")
+                return True
+        except OSError:
+            # Leave missing or unreadable files to process_file to report
+            pass
+        
+        return False
+    
+    def get_file_workers(self) -> int:
+        """Get the number of files that may be processed at once given configuration, free disk and memory."""
+        processing = self.config.get('processing', {})
+        max_workers = processing.get('file_workers', 1)
+        disk_gb_per_worker = processing.get('disk_gb_per_worker', 30)
+        memory_gb_per_worker = processing.get('memory_gb_per_worker', 8)
+        
+        if max_workers <= 1:
+            return max(1, max_workers)
+        
+        num_workers = max_workers
+        
+        # Every worker writes its own output, so bound parallelism by free disk space
+        if disk_gb_per_worker > 0:
+            try:
+                free_gb = shutil.disk_usage(Path.cwd()).free / (1024**3)
+            except OSError as e:
+                logger.warning(f"Could not check free disk space: {e}")
+                return 1
+            
+            num_workers = min(num_workers, int(free_gb // disk_gb_per_worker))
+        
+        # Every worker also holds a whole input file and its transformed copy,
+        # so more workers than memory allows only ends in swapping
+        if memory_gb_per_worker > 0:
+            memory_gb = processing.get('memory_limit_gb', 80)
+            available_gb = self._get_available_memory_gb()
+            if available_gb is not None:
+                memory_gb = min(memory_gb, available_gb)
+            
+            num_workers = min(num_workers, int(memory_gb // memory_gb_per_worker))
+        
+        return max(1, num_workers)
+    
+    def _get_available_memory_gb(self) -> Optional[float]:
+        """
+        Get the memory available to new processes.
+        
+        Returns:
+            Available memory in GB, or None if it cannot be determined
+        """
+        # MemAvailable counts reclaimable page cache, unlike free pages alone
+        try:
+            with open('/proc/meminfo') as f:
+                for line in f:
+                    if line.startswith('MemAvailable:'):
+                        return int(line.split()[1]) / (1024**2)
+        except (OSError, ValueError, IndexError):
+            pass
+        
+        try:
+            return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') / (1024**3)
+        except (AttributeError, ValueError, OSError):
+            return None
+    
     def run(self, source: Optional[str] = None) -> Dict[str, int]:
         """
         Run the complete pipeline.
@@ -200,9 +355,8 @@ class Pipeline:
                 logger.warning("No files extracted from source")
                 return {'processed': 0, 'failed': 0, 'total': 0}
             
-            # Process each extracted file
-            for file_path in extracted_files:
-                self.process_file(str(file_path))
+            # Process the extracted files
+            self.process_files(extracted_files)
             
             # Clean up extractor resources
             self.extractor.cleanup()
@@ -220,20 +374,47 @@ class Pipeline:
             logger.error(f"Pipeline execution failed: {e}")
             raise HpcEtlException(f"Pipeline execution failed: {e}")
     
-    def _read_file(self, file_path: Path) -> pl.DataFrame:
-        """Read file into DataFrame."""
+    def _read_file(self, file_path: Path, schema_overrides: Optional[Dict[str, Any]] = None,
+                   columns: Optional[List[str]] = None) -> pl.DataFrame:
+        """
+        Read file into DataFrame.
+        
+        Args:
+            file_path: Path to the file to read
+            schema_overrides: Optional CSV column dtypes; unparseable values become null
+            columns: Optional columns to read; those missing from the file are
+                skipped, and the whole file is read if none are present
+            
+        Returns:
+            DataFrame with the file contents, empty if it could not be read
+        """
         if file_path.suffix.lower() == '.csv':
             try:
+                # Only parse the requested columns. The lazy scan reads just
+                # the header to find which of them exist
+                if columns:
+                    header = pl.scan_csv(file_path, encoding='utf8-lossy',
+                                         infer_schema_length=0).collect_schema().names()
+                    columns = [col for col in header if col in columns] or None
+                
                 # Try different encodings
                 for encoding in ['utf-8', 'latin-1', 'cp1252']:
                     try:
-                        return pl.read_csv(file_path, encoding=encoding, ignore_errors=True)
+                        data = pl.read_csv(file_path, encoding=encoding, ignore_errors=True,
+                                           columns=columns, schema_overrides=schema_overrides)
                     except Exception:
                         continue
-                
+
+                    # The CSV is read exactly once, release it from the page cache
+                    drop_page_cache(file_path)
+                    return data
+
                 # If all encodings fail, try with error handling
                 logger.warning(f"Using fallback encoding for {file_path}")
-                return pl.read_csv(file_path, ignore_errors=True)
+                data = pl.read_csv(file_path, ignore_errors=True, columns=columns,
+                                   schema_overrides=schema_overrides)
+                drop_page_cache(file_path)
+                return data
                 
             except Exception as e:
                 logger.error(f"Failed to read CSV file {file_path}: {e}")
@@ -241,7 +422,16 @@ class Pipeline:
         
         elif file_path.suffix.lower() == '.parquet':
             try:
-                return pl.read_parquet(file_path)
+                # Project to the requested columns so the others are never
+                # decoded. The schema comes from the file footer
+                parquet_data = pl.scan_parquet(file_path)
+                if columns:
+                    columns = [col for col in parquet_data.collect_schema().names()
+                               if col in columns]
+                    if columns:
+                        parquet_data = parquet_data.select(columns)
+                
+                return parquet_data.collect()
             except Exception as e:
                 logger.error(f"Failed to read Parquet file {file_path}: {e}")
                 return pl.DataFrame()
@@ -277,4 +467,35 @@ class Pipeline:
             'failed_files': self.failed_files,
             'total_files': self.processed_files + self.failed_files,
             'success_rate': (self.processed_files / max(1, self.processed_files + self.failed_files)) * 100
-        }
\ No newline at end of file
+        }
+
+
+_worker_pipeline: Optional[Pipeline] = None
+
+
+def _init_worker(config_path: str, log_level: int, log_queue: Any):
+    """Create the per-process pipeline used by file worker processes."""
+    global _worker_pipeline
+    
+    # Hand every record to the parent, which formats and writes it
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(log_level)
+    
+    _worker_pipeline = Pipeline(config_path)
+
+
+def _process_file_in_worker(file_path: str) -> Tuple[bool, int, int]:
+    """Process a file in a worker process and report the statistics it produced."""
+    processed_before = _worker_pipeline.processed_files
+    failed_before = _worker_pipeline.failed_files
+    
+    success = _worker_pipeline.process_file(file_path)
+    
+    return (
+        success,
+        _worker_pipeline.processed_files - processed_before,
+        _worker_pipeline.failed_files - failed_before
+    )
@@ -1,13 +1,49 @@
 """Base extractor class for data extraction."""
 
+import os
 from abc import ABC, abstractmethod
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import Iterator, Dict, Any, Optional
+from typing import Iterator, Dict, Any, Optional, List
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def find_matching_files(folder: Path, file_patterns: List[str]) -> List[Path]:
+    """
+    List the files in a folder that match any of the given glob patterns.
+    
+    Plain filename patterns are matched against a single scan of the folder,
+    however many there are, and the entry types reported by the scan avoid a
+    stat() call per entry. Patterns containing a subpath or "**" are passed
+    to Path.glob, so every pattern matches exactly as Path.glob would.
+    
+    Args:
+        folder: Folder to search
+        file_patterns: Glob patterns such as "cpu.csv", "*.csv" or "**/*.csv".
+            An empty list matches no files
+            
+    Returns:
+        Matching files, grouped by pattern in pattern order
+    """
+    file_names = None
+    matches = []
+    
+    for pattern in file_patterns:
+        if '**' in pattern or '/' in pattern or os.sep in pattern:
+            matches.extend(path for path in folder.glob(pattern) if path.is_file())
+            continue
+        
+        if file_names is None:
+            with os.scandir(folder) as entries:
+                file_names = [entry.name for entry in entries if entry.is_file()]
+        
+        matches.extend(folder / name for name in file_names if fnmatchcase(name, pattern))
+    
+    return matches
+
+
 class BaseExtractor(ABC):
     """Abstract base class for data extractors."""
     
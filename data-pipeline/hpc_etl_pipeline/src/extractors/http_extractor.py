@@ -1,7 +1,9 @@
 """HTTP-based data extractor for remote repositories."""
 
+import contextlib
 import os
 import re
+import shutil
 import time
 from pathlib import Path
 from typing import Iterator, Dict, Any, Optional, List, Tuple
@@ -10,11 +12,14 @@ import requests
 from bs4 import BeautifulSoup
 import logging
 
-from .base_extractor import BaseExtractor
+from .base_extractor import BaseExtractor, find_matching_files
 from ..core.exceptions import ExtractionError
 
 logger = logging.getLogger(__name__)
 
+# Default monthly folder pattern (YYYY-MM)
+MONTHLY_FOLDER_PATTERN = re.compile(r'^\d{4}-\d{2}/?$')
+
 
 class HttpExtractor(BaseExtractor):
     """Extractor for HTTP-based remote repositories."""
@@ -65,9 +70,7 @@ class HttpExtractor(BaseExtractor):
         if self._download_folder_files(folder_name, folder_temp_dir):
             # Yield all downloaded files
             file_patterns = self.get_file_patterns()
-            for pattern in file_patterns:
-                for file_path in folder_temp_dir.glob(pattern):
-                    yield file_path
+            yield from find_matching_files(folder_temp_dir, file_patterns)
     
     def _download_folder_files(self, folder_name: str, folder_temp_dir: Path) -> bool:
         """Download all required files for a folder."""
@@ -102,7 +105,6 @@ class HttpExtractor(BaseExtractor):
     
     def cleanup(self):
         """Clean up temporary files."""
-        import shutil
         if self.temp_dir.exists():
             shutil.rmtree(self.temp_dir)
             logger.info(f"Cleaned up temporary directory: {self.temp_dir}")
@@ -111,6 +113,8 @@ class HttpExtractor(BaseExtractor):
 class FileDownloader:
     """Handles parallel file downloads with retry logic."""
     
+    CHUNK_SIZE_BYTES = 1024 * 1024
+    
     def __init__(self, max_workers: int = 8, max_retries: int = 3):
         self.max_workers = max_workers
         self.max_retries = max_retries
@@ -119,6 +123,10 @@ class FileDownloader:
     
     def download_file(self, url: str, local_path: str, timeout: int = 300) -> bool:
         """Download a single file with retry logic."""
+        # Download next to the target and rename it into place once complete,
+        # so a partially written file is never visible under its final name
+        part_path = f"{local_path}.part"
+        
         for attempt in range(self.max_retries):
             try:
                 response = self.session.get(url, timeout=timeout, stream=True)
@@ -126,19 +134,25 @@ class FileDownloader:
                 
                 os.makedirs(os.path.dirname(local_path), exist_ok=True)
                 
-                with open(local_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
+                with open(part_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE_BYTES):
                         if chunk:
                             f.write(chunk)
                 
                 # Verify file was downloaded
-                if os.path.exists(local_path) and os.path.getsize(local_path) > 0:
+                if os.path.getsize(part_path) > 0:
+                    os.replace(part_path, local_path)
                     logger.debug(f"Successfully downloaded {url} to {local_path}")
                     return True
                 else:
                     raise Exception("Downloaded file is empty or missing")
                 
             except Exception as e:
+                # The partial file may never have been created, or another
+                # download of the same file may already have removed it
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(part_path)
+                
                 wait_time = (2 ** attempt) * 1  # Exponential backoff
                 logger.warning(f"Download attempt {attempt + 1} failed for {url}: {e}")
                 
@@ -197,8 +211,9 @@ class FolderDiscovery:
             soup = BeautifulSoup(response.content, 'html.parser')
             folders = []
             
-            # Use provided pattern or default monthly pattern
-            pattern = folder_pattern or r'^\d{4}-\d{2}/?$'
+            # Use provided pattern or default monthly pattern, compiled once
+            # rather than per link
+            pattern = re.compile(folder_pattern) if folder_pattern else MONTHLY_FOLDER_PATTERN
             
             # Look for links that match the pattern
             for link in soup.find_all('a', href=True):
@@ -215,6 +230,6 @@ class FolderDiscovery:
             logger.error(f"Error discovering folders from {self.base_url}: {e}")
             return []
     
-    def _matches_pattern(self, folder_name: str, pattern: str) -> bool:
+    def _matches_pattern(self, folder_name: str, pattern: re.Pattern) -> bool:
         """Check if folder name matches the given pattern."""
-        return bool(re.match(pattern, folder_name))
\ No newline at end of file
+        return bool(pattern.match(folder_name))
\ No newline at end of file
@@ -1,11 +1,12 @@
 """Local filesystem extractor."""
 
+import os
 import re
 from pathlib import Path
 from typing import Iterator, Dict, Any, Optional
 import logging
 
-from .base_extractor import BaseExtractor
+from .base_extractor import BaseExtractor, find_matching_files
 from ..core.exceptions import ExtractionError
 
 logger = logging.getLogger(__name__)
@@ -51,26 +52,21 @@ class LocalExtractor(BaseExtractor):
         
         if folder_pattern:
             # Look for folders matching the pattern first
-            for item in directory.iterdir():
-                if item.is_dir() and re.match(folder_pattern, item.name):
-                    yield from self._extract_files_from_folder(item, file_patterns)
+            folder_regex = re.compile(folder_pattern)
+            with os.scandir(directory) as entries:
+                folders = [Path(entry.path) for entry in entries
+                           if entry.is_dir() and folder_regex.match(entry.name)]
+            
+            for folder in folders:
+                yield from self._extract_files_from_folder(folder, file_patterns)
         else:
             # Extract files directly from the directory
             yield from self._extract_files_from_folder(directory, file_patterns)
     
     def _extract_files_from_folder(self, folder: Path, file_patterns: list) -> Iterator[Path]:
         """Extract files matching patterns from a folder."""
-        if not file_patterns:
-            # If no patterns specified, yield all files
-            for file_path in folder.iterdir():
-                if file_path.is_file():
-                    yield file_path
-        else:
-            # Match against patterns
-            for pattern in file_patterns:
-                for file_path in folder.glob(pattern):
-                    if file_path.is_file():
-                        yield file_path
+        # With no patterns every file is yielded
+        yield from find_matching_files(folder, file_patterns or ['*'])
     
     def validate_source(self) -> bool:
         """Validate that the local source is accessible."""
@@ -1,6 +1,7 @@
 """Base loader class for data loading."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 import polars as pl
@@ -58,6 +59,14 @@ class BaseLoader(ABC):
         """Get compression setting from configuration."""
         return self.output_config.get('compression', 'snappy')
     
+    def get_value_dtype(self) -> str:
+        """Get the storage precision of the Value column ('float64' or 'float32')."""
+        return self.output_config.get('value_dtype', 'float64')
+    
+    def get_row_group_size(self) -> Optional[int]:
+        """Get maximum rows per Parquet row group, or None for the writer default."""
+        return self.output_config.get('row_group_size')
+    
     def should_chunk(self) -> bool:
         """Check if chunking is enabled."""
         chunking = self.output_config.get('chunking', {})
@@ -88,7 +97,6 @@ class BaseLoader(ABC):
         
         # Add default values if not in metadata
         if 'timestamp' not in metadata:
-            from datetime import datetime
             metadata['timestamp'] = datetime.now().strftime('%Y%m%d_%H%M%S')
         
         # Replace template variables
@@ -1,6 +1,5 @@
 """Parquet file loader with chunking support."""
 
-import gc
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 import polars as pl
@@ -8,6 +7,8 @@ import logging
 
 from .base_loader import BaseLoader
 from ..core.exceptions import LoadError
+from ..utils.file_cache import drop_page_cache
+from ..utils.validators import validate_parquet_file
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,15 @@ logger = logging.getLogger(__name__)
 class ParquetLoader(BaseLoader):
     """Loads data to Parquet format with optional chunking."""
     
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        
+        # Writer options are fixed per dataset, so resolve them once
+        self.write_options = {
+            'compression': self.get_compression(),
+            'row_group_size': self.get_row_group_size()
+        }
+    
     def load(self, data: pl.DataFrame, output_path: Path, metadata: Optional[Dict[str, Any]] = None) -> bool:
         """
         Load data to Parquet file with optional chunking.
@@ -35,6 +45,11 @@ class ParquetLoader(BaseLoader):
             # Ensure output directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
+            # Metric values need far less than double precision, and Float32
+            # halves their size in memory and on disk
+            if self.get_value_dtype() == 'float32' and 'Value' in data.columns:
+                data = data.with_columns(pl.col('Value').cast(pl.Float32))
+            
             if self.should_chunk():
                 return self._save_with_chunking(data, output_path, metadata)
             else:
@@ -46,12 +61,12 @@ class ParquetLoader(BaseLoader):
     def _save_single_file(self, data: pl.DataFrame, output_path: Path) -> bool:
         """Save data as a single Parquet file."""
         try:
-            compression = self.get_compression()
-            data.write_parquet(output_path, compression=compression)
+            data.write_parquet(output_path, **self.write_options)
             
             # Validate the saved file
             if self.validate_output(output_path):
                 logger.info(f"Successfully saved {len(data)} rows to {output_path}")
+                drop_page_cache(output_path, written=True)
                 return True
             else:
                 logger.error(f"Validation failed for {output_path}")
@@ -114,20 +129,16 @@ class ParquetLoader(BaseLoader):
                 chunk_data = data.slice(start_idx, end_idx - start_idx)
                 
                 # Save chunk
-                compression = self.get_compression()
-                chunk_data.write_parquet(chunk_path, compression=compression)
+                chunk_data.write_parquet(chunk_path, **self.write_options)
                 
                 # Validate chunk
                 if self.validate_output(chunk_path):
                     logger.info(f"Saved chunk {i + 1}/{num_chunks}: {len(chunk_data)} rows to {chunk_filename}")
+                    drop_page_cache(chunk_path, written=True)
                     chunks_saved += 1
                 else:
                     logger.error(f"Validation failed for chunk {chunk_filename}")
                 
-                # Clean up chunk data from memory
-                del chunk_data
-                gc.collect()
-                
             except Exception as e:
                 logger.error(f"Failed to save chunk {i + 1}: {e}")
                 continue
@@ -136,42 +147,8 @@ class ParquetLoader(BaseLoader):
         return chunks_saved
     
     def validate_output(self, output_path: Path) -> bool:
-        """Validate that the Parquet file was created successfully."""
-        try:
-            if not output_path.exists():
-                logger.error(f"Output file does not exist: {output_path}")
-                return False
-            
-            file_size = output_path.stat().st_size
-            if file_size == 0:
-                logger.error(f"Output file is empty: {output_path}")
-                return False
-            
-            # Try to read a sample to verify file integrity
-            try:
-                sample = pl.read_parquet(output_path, n_rows=10)
-                if sample.is_empty():
-                    logger.error(f"Output file appears to be empty: {output_path}")
-                    return False
-                
-                # Validate against expected schema if configured
-                expected_columns = self._get_expected_columns()
-                if expected_columns:
-                    missing_columns = set(expected_columns) - set(sample.columns)
-                    if missing_columns:
-                        logger.error(f"Output file missing expected columns: {missing_columns}")
-                        return False
-                
-                logger.debug(f"Validated output file: {output_path} ({file_size} bytes)")
-                return True
-                
-            except Exception as e:
-                logger.error(f"Failed to read output file for validation: {e}")
-                return False
-                
-        except Exception as e:
-            logger.error(f"Error validating output file {output_path}: {e}")
-            return False
+        """Validate that the Parquet file was created successfully, from its footer only."""
+        return validate_parquet_file(output_path, required_columns=self._get_expected_columns())
     
     def _get_expected_columns(self) -> List[str]:
         """Get expected output columns from configuration."""
@@ -2,7 +2,6 @@
 
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
-import pandas as pd
 import polars as pl
 import logging
 
@@ -12,6 +11,12 @@ logger = logging.getLogger(__name__)
 class BaseTransformer(ABC):
     """Abstract base class for data transformers."""
     
+    TIMESTAMP_FORMAT = '%m/%d/%Y %H:%M:%S'
+    
+    # Column dtypes to apply while reading raw input, so values are parsed
+    # straight to their final type instead of being inferred and cast again
+    INPUT_SCHEMA: Dict[str, Any] = {}
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize transformer with configuration.
@@ -36,6 +41,21 @@ class BaseTransformer(ABC):
         """
         pass
     
+    def parse_timestamp(self, column: str = 'timestamp') -> pl.Expr:
+        """
+        Build an expression parsing a raw timestamp column to Datetime.
+        
+        All transformers parse the raw TACC Stats timestamp with the fixed
+        TIMESTAMP_FORMAT, so Polars never has to infer the format.
+        
+        Args:
+            column: Name of the raw timestamp column
+            
+        Returns:
+            Datetime expression, null where the value cannot be parsed
+        """
+        return pl.col(column).str.strptime(pl.Datetime, format=self.TIMESTAMP_FORMAT, strict=False)
+    
     def validate_input(self, data: pl.DataFrame) -> bool:
         """
         Validate input data before transformation.
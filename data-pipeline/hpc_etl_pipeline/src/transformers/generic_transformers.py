@@ -1,5 +1,6 @@
 """Generic reusable data transformers."""
 
+import re
 from typing import Dict, Any, List, Optional
 import polars as pl
 import logging
@@ -9,6 +10,16 @@ from ..core.exceptions import TransformationError
 
 logger = logging.getLogger(__name__)
 
+# Column types of the standard output schema, used to type placeholder columns
+STANDARD_COLUMN_TYPES = {
+    'Job Id': pl.Utf8,
+    'Host': pl.Utf8,
+    'Event': pl.Utf8,
+    'Value': pl.Float64,
+    'Units': pl.Utf8,
+    'Timestamp': pl.Datetime
+}
+
 
 class SuffixTransformer(BaseTransformer):
     """Adds suffixes to specified columns."""
@@ -35,15 +46,14 @@ class SuffixTransformer(BaseTransformer):
             return data
         
         try:
-            # Apply suffix to specified columns that exist in the dataframe
+            # Apply suffix to specified columns that exist in the dataframe.
+            # Native string concatenation keeps nulls as nulls without a
+            # Python callback per row
             transformations = []
             for col in columns:
                 if col in data.columns:
                     transformations.append(
-                        pl.col(col).map_elements(
-                            lambda x: f"{x}{suffix}" if x is not None else x,
-                            return_dtype=pl.Utf8
-                        ).alias(col)
+                        (pl.col(col).cast(pl.Utf8) + pl.lit(suffix)).alias(col)
                     )
             
             if transformations:
@@ -66,7 +76,7 @@ class ColumnReorderTransformer(BaseTransformer):
             return data
         
         expected_columns = self.get_expected_columns()
-        if not expected_columns:
+        if not expected_columns or data.columns == expected_columns:
             return data
         
         try:
@@ -109,27 +119,33 @@ class StringNormalizer(BaseTransformer):
         try:
             transformations = []
             
+            # Plain-text patterns such as "jobID" do not need the regex engine,
+            # a literal substring replacement gives the same result
+            replacements = []
+            for pattern in patterns:
+                find_str = pattern.get('find', '')
+                replace_str = pattern.get('replace', '')
+                if find_str:
+                    literal = re.escape(find_str) == find_str and '$' not in replace_str
+                    replacements.append((find_str, replace_str, literal))
+            
+            # Look up every column's dtype from the schema in one pass
+            schema = data.schema
+            
             # Apply patterns to all string columns
             for col in data.columns:
-                if data[col].dtype == pl.Utf8:
+                if schema[col] == pl.Utf8:
                     col_expr = pl.col(col)
                     
                     # Apply each pattern replacement
-                    for pattern in patterns:
-                        find_str = pattern.get('find', '')
-                        replace_str = pattern.get('replace', '')
-                        if find_str:
-                            col_expr = col_expr.str.replace_all(find_str, replace_str)
+                    for find_str, replace_str, literal in replacements:
+                        col_expr = col_expr.str.replace_all(find_str, replace_str, literal=literal)
                     
                     transformations.append(col_expr.alias(col))
             
             if transformations:
-                # Keep non-string columns as they are
-                non_string_cols = [pl.col(col) for col in data.columns 
-                                 if data[col].dtype != pl.Utf8]
-                all_transformations = transformations + non_string_cols
-                
-                result = data.with_columns(all_transformations)
+                # with_columns keeps the non-string columns as they are
+                result = data.with_columns(transformations)
                 logger.debug(f"Applied string normalization patterns to {len(transformations)} columns")
                 return result
             
@@ -149,33 +165,23 @@ class TimestampNormalizer(BaseTransformer):
         
         try:
             transformations = []
+            schema = data.schema
             
             # Look for timestamp-like columns
             timestamp_columns = [col for col in data.columns 
                                if 'time' in col.lower() or 'timestamp' in col.lower()]
             
             for col in timestamp_columns:
-                if col in data.columns:
-                    # Try to parse as datetime if it's not already
-                    if data[col].dtype != pl.Datetime:
-                        try:
-                            # Attempt to parse various timestamp formats
-                            transformations.append(
-                                pl.col(col).str.strptime(pl.Datetime, format=None, strict=False).alias(col)
-                            )
-                        except:
-                            # If parsing fails, keep original
-                            transformations.append(pl.col(col))
-                    else:
-                        transformations.append(pl.col(col))
+                # Try to parse as datetime if it's not already
+                if schema[col] != pl.Datetime:
+                    # Attempt to parse various timestamp formats
+                    transformations.append(
+                        pl.col(col).str.strptime(pl.Datetime, format=None, strict=False).alias(col)
+                    )
             
             if transformations:
-                # Keep other columns as they are
-                other_cols = [pl.col(col) for col in data.columns 
-                            if col not in timestamp_columns]
-                all_transformations = transformations + other_cols
-                
-                result = data.with_columns(all_transformations)
+                # with_columns keeps all other columns as they are
+                result = data.with_columns(transformations)
                 logger.debug(f"Normalized timestamps in columns: {timestamp_columns}")
                 return result
             
@@ -218,6 +224,12 @@ class SchemaStandardizer(BaseTransformer):
         if not expected_columns:
             return data
         
+        # HPC transformers already emit the standard schema in order, so
+        # there is nothing to project
+        if data.columns == expected_columns:
+            logger.debug("Data already matches expected schema")
+            return data
+        
         try:
             # Start with available columns that match expected schema
             available_columns = []
@@ -228,8 +240,10 @@ class SchemaStandardizer(BaseTransformer):
                     available_columns.append(expected_col)
                     transformations.append(pl.col(expected_col))
                 else:
-                    # Add placeholder for missing columns
-                    transformations.append(pl.lit(None).alias(expected_col))
+                    # Add a typed placeholder for missing columns so the column
+                    # matches the output schema instead of being a Null column
+                    dtype = STANDARD_COLUMN_TYPES.get(expected_col)
+                    transformations.append(pl.lit(None, dtype=dtype).alias(expected_col))
                     logger.debug(f"Added placeholder for missing column: {expected_col}")
             
             if transformations:
@@ -285,6 +299,7 @@ class CompositeTransformer(BaseTransformer):
                 result = transformer.transform(result, metadata)
             except Exception as e:
                 logger.error(f"Transformation failed with {transformer.__class__.__name__}: {e}")
+                logger.debug("Traceback:", exc_info=True)
                 # Continue with other transformations
                 continue
         
@@ -17,6 +17,15 @@ class BlockIOTransformer(BaseTransformer):
     BYTES_TO_GB = 1 / (1024 ** 3)
     MIN_TIME_DELTA = 0.1
     
+    INPUT_SCHEMA = {
+        'rd_sectors': pl.Float64,
+        'wr_sectors': pl.Float64,
+        'jobID': pl.Utf8,
+        'node': pl.Utf8,
+        'device': pl.Utf8,
+        'timestamp': pl.Utf8
+    }
+    
     def transform(self, data: pl.DataFrame, metadata: Optional[Dict[str, Any]] = None) -> pl.DataFrame:
         """Transform block I/O data to throughput rates."""
         if not self.validate_input(data):
@@ -29,13 +38,15 @@ class BlockIOTransformer(BaseTransformer):
             if missing_cols:
                 raise TransformationError(f"Missing required columns: {missing_cols}")
             
-            # Convert numeric columns and handle errors
-            df = data.with_columns([
+            # Convert numeric columns and handle errors, keeping only the
+            # columns used below so the sort does not reorder unused data
+            df = data.select([
                 pl.col('rd_sectors').cast(pl.Float64, strict=False),
                 pl.col('wr_sectors').cast(pl.Float64, strict=False),
                 pl.col('jobID').fill_null('unknown').cast(pl.Utf8),
                 pl.col('node').fill_null('unknown').cast(pl.Utf8),
-                pl.col('device').fill_null('unknown').cast(pl.Utf8)
+                pl.col('device').fill_null('unknown').cast(pl.Utf8),
+                pl.col('timestamp')
             ])
             
             # Drop rows with invalid numeric data
@@ -50,8 +61,8 @@ class BlockIOTransformer(BaseTransformer):
             
             # Clean job ID and parse timestamp
             df = df.with_columns([
-                pl.col('jobID').str.replace_all('jobID', 'JOB', literal=False),
-                pl.col('timestamp').str.strptime(pl.Datetime, format='%m/%d/%Y %H:%M:%S', strict=False).alias('Timestamp_original')
+                pl.col('jobID').str.replace_all('jobID', 'JOB', literal=True),
+                self.parse_timestamp().alias('Timestamp_original')
             ])
             
             # Filter out rows with invalid timestamps
@@ -60,6 +71,14 @@ class BlockIOTransformer(BaseTransformer):
                 logger.info("No valid data rows after timestamp filtering")
                 return pl.DataFrame()
             
+            # Sort, window and group on categorical codes rather than hashing
+            # and comparing the repeated key strings row by row
+            df = df.with_columns([
+                pl.col('jobID').cast(pl.Categorical),
+                pl.col('node').cast(pl.Categorical),
+                pl.col('device').cast(pl.Categorical)
+            ])
+            
             # Sort by job, node, device, timestamp
             df = df.sort(['jobID', 'node', 'device', 'Timestamp_original'])
             
@@ -92,13 +111,14 @@ class BlockIOTransformer(BaseTransformer):
             ])
             
             # Create final output with standardized schema
-            result = node_aggregated.with_columns([
-                pl.col('jobID').alias('Job Id'),
-                pl.col('node').alias('Host'),
+            result = node_aggregated.select([
+                pl.col('jobID').cast(pl.Utf8).alias('Job Id'),
+                pl.col('node').cast(pl.Utf8).alias('Host'),
                 pl.lit('block').alias('Event'),
+                pl.col('Value'),
                 pl.lit('GB/s').alias('Units'),
                 pl.col('Timestamp_original').alias('Timestamp')
-            ]).select(['Job Id', 'Host', 'Event', 'Value', 'Units', 'Timestamp'])
+            ])
             
             logger.info(f"Processed block I/O data: {len(result)} output rows")
             return result
@@ -112,6 +132,14 @@ class CPUTransformer(BaseTransformer):
     
     CPU_JIFFY_COLUMNS = ['user', 'nice', 'system', 'idle', 'iowait', 'irq', 'softirq']
     
+    INPUT_SCHEMA = {
+        **{col: pl.Float64 for col in CPU_JIFFY_COLUMNS},
+        'jobID': pl.Utf8,
+        'node': pl.Utf8,
+        'device': pl.Utf8,
+        'timestamp': pl.Utf8
+    }
+    
     def transform(self, data: pl.DataFrame, metadata: Optional[Dict[str, Any]] = None) -> pl.DataFrame:
         """Transform CPU data to user percentage."""
         if not self.validate_input(data):
@@ -127,97 +155,111 @@ class CPUTransformer(BaseTransformer):
             # Convert all jiffy columns to numeric
             jiffy_casts = [pl.col(col).cast(pl.Float64, strict=False) for col in self.CPU_JIFFY_COLUMNS]
             
-            df = data.with_columns([
-                *jiffy_casts,
-                pl.col('jobID').fill_null('unknown').cast(pl.Utf8),
-                pl.col('node').fill_null('unknown').cast(pl.Utf8),
-                pl.col('device').fill_null('unknown').cast(pl.Utf8)
-            ])
-            
             # Drop rows with any invalid jiffy values
             jiffy_filter = pl.fold(
                 acc=pl.lit(True),
                 function=lambda acc, x: acc & x.is_not_null(),
                 exprs=[pl.col(col) for col in self.CPU_JIFFY_COLUMNS]
             )
-            df = df.filter(jiffy_filter)
-            
-            if df.is_empty():
-                logger.info("No valid data rows after filtering invalid CPU values")
-                return pl.DataFrame()
-            
-            # Clean job ID and parse timestamp
-            df = df.with_columns([
-                pl.col('jobID').str.replace_all('jobID', 'JOB', literal=False),
-                pl.col('timestamp').str.strptime(pl.Datetime, format='%m/%d/%Y %H:%M:%S', strict=False).alias('Timestamp_original')
-            ])
             
-            # Filter out rows with invalid timestamps
-            df = df.filter(pl.col('Timestamp_original').is_not_null())
-            if df.is_empty():
-                logger.info("No valid data rows after timestamp filtering")
-                return pl.DataFrame()
-            
-            # Sort by job, node, device (CPU core), timestamp
-            df = df.sort(['jobID', 'node', 'device', 'Timestamp_original'])
-            
-            # Calculate total jiffies
-            df = df.with_columns([
-                pl.sum_horizontal([pl.col(col) for col in self.CPU_JIFFY_COLUMNS]).alias('total_jiffies')
-            ])
-            
-            # Calculate deltas for each jiffy column per CPU core
+            # Rows are sorted by CPU core, so a core's first sample is the row
+            # where any key changes; it has no previous measurement to diff against
+            core_start = (
+                (pl.col('jobID') != pl.col('jobID').shift(1)) |
+                (pl.col('node') != pl.col('node').shift(1)) |
+                (pl.col('device') != pl.col('device').shift(1))
+            ).fill_null(True)
+            
+            # Calculate deltas per CPU core using the shared boundary mask
+            # instead of one window partition per column. Only user, nice and
+            # the total feed the output; the other jiffy counters are needed
+            # solely through total_jiffies. The cumulative counters need
+            # Float64 to stay exact, but deltas between samples are small
+            # enough for Float32, which halves the memory moved by the filter
+            # and node-level aggregation.
             delta_exprs = []
-            for col in self.CPU_JIFFY_COLUMNS:
+            for col in ['user', 'nice', 'total_jiffies']:
                 delta_exprs.append(
-                    pl.col(col).diff().over(['jobID', 'node', 'device']).alias(f'{col}_delta')
+                    pl.when(pl.col('_core_start')).then(None).otherwise(pl.col(col).diff())
+                    .cast(pl.Float32).alias(f'{col}_delta')
                 )
-            delta_exprs.append(
-                pl.col('total_jiffies').diff().over(['jobID', 'node', 'device']).alias('total_jiffies_delta')
-            )
-            
-            df = df.with_columns(delta_exprs)
             
-            # Filter valid deltas (positive values, not first measurement)
+            # Filter valid deltas (positive values, not first measurement).
+            # Comparisons against the null delta of a core's first sample are
+            # null, which filter() drops, so no separate null checks are needed
             valid_filter = (
-                pl.col('total_jiffies_delta').is_not_null() &
                 (pl.col('total_jiffies_delta') > 0) &
-                pl.col('user_delta').is_not_null() &
-                pl.col('nice_delta').is_not_null() &
                 (pl.col('user_delta') >= 0) &
                 (pl.col('nice_delta') >= 0)
             )
-            df = df.filter(valid_filter)
             
-            if df.is_empty():
+            # Node-level sums of the per-core deltas
+            user_delta_sum = pl.col('user_delta').sum()
+            nice_delta_sum = pl.col('nice_delta').sum()
+            total_delta_sum = pl.col('total_jiffies_delta').sum()
+            
+            # Build the whole computation as one lazy query so Polars can prune
+            # unused columns and fuse the filters and projections
+            result = (
+                data.lazy()
+                .with_columns([
+                    *jiffy_casts,
+                    pl.col('jobID').fill_null('unknown').cast(pl.Utf8),
+                    pl.col('node').fill_null('unknown').cast(pl.Utf8),
+                    pl.col('device').fill_null('unknown').cast(pl.Utf8)
+                ])
+                .filter(jiffy_filter)
+                # Clean job ID and parse timestamp
+                .with_columns([
+                    pl.col('jobID').str.replace_all('jobID', 'JOB', literal=True),
+                    self.parse_timestamp().alias('Timestamp_original')
+                ])
+                # Filter out rows with invalid timestamps
+                .filter(pl.col('Timestamp_original').is_not_null())
+                # Sort and group on categorical codes rather than hashing and
+                # comparing the repeated key strings row by row
+                .with_columns([
+                    pl.col('jobID').cast(pl.Categorical),
+                    pl.col('node').cast(pl.Categorical),
+                    pl.col('device').cast(pl.Categorical)
+                ])
+                # Sort by job, node, device (CPU core), timestamp
+                .sort(['jobID', 'node', 'device', 'Timestamp_original'])
+                # Calculate total jiffies
+                .with_columns([
+                    pl.sum_horizontal([pl.col(col) for col in self.CPU_JIFFY_COLUMNS]).alias('total_jiffies'),
+                    core_start.alias('_core_start')
+                ])
+                .with_columns(delta_exprs)
+                .filter(valid_filter)
+                # Aggregate deltas from CPU cores to node level and calculate
+                # the CPU user percentage in the same pass, without
+                # materializing the per-node sums as separate columns. Every
+                # surviving row has a positive total delta, so the node total
+                # is positive as well
+                .group_by(['jobID', 'node', 'Timestamp_original'])
+                .agg([
+                    (((user_delta_sum + nice_delta_sum) / total_delta_sum) * 100.0)
+                    .clip(0.0, 100.0)
+                    .cast(pl.Float64)
+                    .alias('Value')
+                ])
+                # Create final output with standardized schema
+                .select([
+                    pl.col('jobID').cast(pl.Utf8).alias('Job Id'),
+                    pl.col('node').cast(pl.Utf8).alias('Host'),
+                    pl.lit('cpuuser').alias('Event'),
+                    pl.col('Value'),
+                    pl.lit('CPU %').alias('Units'),
+                    pl.col('Timestamp_original').alias('Timestamp')
+                ])
+                .collect()
+            )
+            
+            if result.is_empty():
                 logger.info("No valid CPU delta data after filtering")
                 return pl.DataFrame()
             
-            # Aggregate deltas from CPU cores to node level
-            node_aggregated = df.group_by(['jobID', 'node', 'Timestamp_original']).agg([
-                pl.col('user_delta').sum().alias('user_delta_sum'),
-                pl.col('nice_delta').sum().alias('nice_delta_sum'),
-                pl.col('total_jiffies_delta').sum().alias('total_jiffies_delta_sum')
-            ])
-            
-            # Calculate CPU user percentage at node level
-            node_aggregated = node_aggregated.with_columns([
-                pl.when(pl.col('total_jiffies_delta_sum') > 0)
-                .then(((pl.col('user_delta_sum') + pl.col('nice_delta_sum')) / pl.col('total_jiffies_delta_sum')) * 100.0)
-                .otherwise(0.0)
-                .clip(0.0, 100.0)
-                .alias('Value')
-            ])
-            
-            # Create final output with standardized schema
-            result = node_aggregated.with_columns([
-                pl.col('jobID').alias('Job Id'),
-                pl.col('node').alias('Host'),
-                pl.lit('cpuuser').alias('Event'),
-                pl.lit('CPU %').alias('Units'),
-                pl.col('Timestamp_original').alias('Timestamp')
-            ]).select(['Job Id', 'Host', 'Event', 'Value', 'Units', 'Timestamp'])
-            
             logger.info(f"Processed CPU data: {len(result)} output rows")
             return result
             
@@ -230,6 +272,15 @@ class MemoryTransformer(BaseTransformer):
     
     BYTES_TO_GB = 1 / (1024 ** 3)
     
+    INPUT_SCHEMA = {
+        'MemTotal': pl.Float64,
+        'MemFree': pl.Float64,
+        'FilePages': pl.Float64,
+        'jobID': pl.Utf8,
+        'node': pl.Utf8,
+        'timestamp': pl.Utf8
+    }
+    
     def transform(self, data: pl.DataFrame, metadata: Optional[Dict[str, Any]] = None) -> pl.DataFrame:
         """Transform memory data to usage metrics."""
         if not self.validate_input(data):
@@ -264,8 +315,8 @@ class MemoryTransformer(BaseTransformer):
             
             # Clean job ID and parse timestamp
             df = df.with_columns([
-                pl.col('jobID').str.replace_all('jobID', 'JOB', literal=False),
-                pl.col('timestamp').str.strptime(pl.Datetime, format='%m/%d/%Y %H:%M:%S', strict=False).alias('Timestamp_original')
+                pl.col('jobID').str.replace_all('jobID', 'JOB', literal=True),
+                self.parse_timestamp().alias('Timestamp_original')
             ])
             
             # Filter out rows with invalid timestamps
@@ -274,60 +325,43 @@ class MemoryTransformer(BaseTransformer):
                 logger.info("No valid data rows after timestamp filtering")
                 return pl.DataFrame()
             
-            # Validate and bound memory values
-            df = df.with_columns([
-                # Ensure all values are non-negative
-                pl.col('MemTotal').clip(0.0, None),
-                pl.col('MemFree').clip(0.0, None),
-                pl.col('FilePages').clip(0.0, None)
-            ])
-            
+            # Bound the memory values and calculate both metrics as fused
+            # expressions evaluated in the projection below, instead of one
+            # pass over the frame per step
+            mem_total = pl.col('MemTotal').clip(0.0, None)
             # Ensure MemFree <= MemTotal
-            df = df.with_columns([
-                pl.min_horizontal([pl.col('MemFree'), pl.col('MemTotal')]).alias('MemFree')
-            ])
-            
-            # Calculate memory used
-            df = df.with_columns([
-                (pl.col('MemTotal') - pl.col('MemFree')).alias('memory_used')
-            ])
-            
-            # Ensure FilePages <= MemTotal and <= memory_used
-            df = df.with_columns([
-                pl.min_horizontal([
-                    pl.col('FilePages'), 
-                    pl.col('MemTotal'), 
-                    pl.col('memory_used')
-                ]).alias('FilePages')
-            ])
-            
-            # Calculate both memory metrics
-            df = df.with_columns([
-                (pl.col('memory_used') * self.BYTES_TO_GB).alias('memused_value'),
-                ((pl.col('memory_used') - pl.col('FilePages')) * self.BYTES_TO_GB).alias('memused_minus_diskcache_value')
-            ])
-            
-            # Create two output rows per input row (one for each metric)
-            memused_rows = df.select([
-                pl.col('jobID').alias('Job Id'),
-                pl.col('node').alias('Host'),
-                pl.lit('memused').alias('Event'),
-                pl.col('memused_value').alias('Value'),
-                pl.lit('GB').alias('Units'),
-                pl.col('Timestamp_original').alias('Timestamp')
-            ])
-            
-            memused_minus_cache_rows = df.select([
+            mem_free = pl.min_horizontal([pl.col('MemFree').clip(0.0, None), mem_total])
+            memory_used = mem_total - mem_free
+            # Ensure FilePages <= memory_used, which is itself <= MemTotal
+            file_pages = pl.min_horizontal([pl.col('FilePages').clip(0.0, None), memory_used])
+            
+            # Create two output rows per input row (one for each metric). Both
+            # halves share the key columns of one narrow frame, and are stacked
+            # without rechunking so they are not copied into a new buffer
+            base = df.select([
                 pl.col('jobID').alias('Job Id'),
                 pl.col('node').alias('Host'),
-                pl.lit('memused_minus_diskcache').alias('Event'),
-                pl.col('memused_minus_diskcache_value').alias('Value'),
-                pl.lit('GB').alias('Units'),
-                pl.col('Timestamp_original').alias('Timestamp')
+                pl.col('Timestamp_original').alias('Timestamp'),
+                (memory_used * self.BYTES_TO_GB).alias('memused_value'),
+                ((memory_used - file_pages) * self.BYTES_TO_GB).alias('memused_minus_diskcache_value')
             ])
             
-            # Combine both result sets
-            result = pl.concat([memused_rows, memused_minus_cache_rows])
+            metric_frames = [
+                base.select([
+                    pl.col('Job Id'),
+                    pl.col('Host'),
+                    pl.lit(event).alias('Event'),
+                    pl.col(value_column).alias('Value'),
+                    pl.lit('GB').alias('Units'),
+                    pl.col('Timestamp')
+                ])
+                for event, value_column in [
+                    ('memused', 'memused_value'),
+                    ('memused_minus_diskcache', 'memused_minus_diskcache_value')
+                ]
+            ]
+            
+            result = pl.concat(metric_frames, rechunk=False)
             
             logger.info(f"Processed memory data: {len(result)} output rows")
             return result
@@ -342,6 +376,14 @@ class NFSTransformer(BaseTransformer):
     BYTES_TO_MB = 1 / (1024 * 1024)
     MIN_TIME_DELTA = 0.1
     
+    INPUT_SCHEMA = {
+        'read_bytes': pl.Float64,
+        'write_bytes': pl.Float64,
+        'jobID': pl.Utf8,
+        'node': pl.Utf8,
+        'timestamp': pl.Utf8
+    }
+    
     def transform(self, data: pl.DataFrame, metadata: Optional[Dict[str, Any]] = None) -> pl.DataFrame:
         """Transform NFS data to transfer rates."""
         if not self.validate_input(data):
@@ -354,12 +396,14 @@ class NFSTransformer(BaseTransformer):
             if missing_cols:
                 raise TransformationError(f"Missing required columns: {missing_cols}")
             
-            # Convert numeric columns
-            df = data.with_columns([
+            # Convert numeric columns, keeping only the columns used below so
+            # the sort does not reorder unused data
+            df = data.select([
                 pl.col('read_bytes').cast(pl.Float64, strict=False),
                 pl.col('write_bytes').cast(pl.Float64, strict=False),
                 pl.col('jobID').fill_null('unknown').cast(pl.Utf8),
-                pl.col('node').fill_null('unknown').cast(pl.Utf8)
+                pl.col('node').fill_null('unknown').cast(pl.Utf8),
+                pl.col('timestamp')
             ])
             
             # Drop rows with invalid values
@@ -374,8 +418,8 @@ class NFSTransformer(BaseTransformer):
             
             # Clean job ID and parse timestamp
             df = df.with_columns([
-                pl.col('jobID').str.replace_all('jobID', 'JOB', literal=False),
-                pl.col('timestamp').str.strptime(pl.Datetime, format='%m/%d/%Y %H:%M:%S', strict=False).alias('Timestamp_original')
+                pl.col('jobID').str.replace_all('jobID', 'JOB', literal=True),
+                self.parse_timestamp().alias('Timestamp_original')
             ])
             
             # Filter out rows with invalid timestamps
@@ -392,35 +436,46 @@ class NFSTransformer(BaseTransformer):
                 (pl.col('read_bytes') + pl.col('write_bytes')).alias('total_bytes')
             ])
             
-            # Calculate time and byte deltas within each node group
-            df = df.with_columns([
-                pl.col('Timestamp_original').diff().over(['jobID', 'node']).dt.total_seconds().alias('time_delta_seconds'),
-                pl.col('total_bytes').diff().over(['jobID', 'node']).alias('byte_delta')
-            ])
+            # Calculate time and byte deltas within each node group. Rows are
+            # sorted by node, so a node's first sample is the row where the
+            # key changes, and both deltas share that one boundary mask. The
+            # time delta is an integer diff of the microsecond epoch rather
+            # than a Duration column converted to seconds
+            node_start = (
+                (pl.col('jobID') != pl.col('jobID').shift(1)) |
+                (pl.col('node') != pl.col('node').shift(1))
+            ).fill_null(True)
             
-            # Calculate NFS transfer rates
             df = df.with_columns([
-                pl.when(
-                    (pl.col('time_delta_seconds').is_not_null()) &
-                    (pl.col('time_delta_seconds') >= self.MIN_TIME_DELTA) &
-                    (pl.col('byte_delta').is_not_null()) &
-                    (pl.col('byte_delta') >= 0)
-                ).then(
-                    (pl.col('byte_delta') * self.BYTES_TO_MB) / pl.col('time_delta_seconds')
-                ).otherwise(0.0).alias('Value')
+                pl.when(node_start).then(None)
+                .otherwise(pl.col('Timestamp_original').dt.epoch('us').diff() / 1_000_000)
+                .alias('time_delta_seconds'),
+                pl.when(node_start).then(None)
+                .otherwise(pl.col('total_bytes').diff())
+                .alias('byte_delta')
             ])
             
             # Filter out first measurements (no deltas available)
             df = df.filter(pl.col('time_delta_seconds').is_not_null())
             
+            # Calculate NFS transfer rates. A null byte delta makes the
+            # condition null, which when() treats as false
+            rate = pl.when(
+                (pl.col('time_delta_seconds') >= self.MIN_TIME_DELTA) &
+                (pl.col('byte_delta') >= 0)
+            ).then(
+                (pl.col('byte_delta') * self.BYTES_TO_MB) / pl.col('time_delta_seconds')
+            ).otherwise(0.0)
+            
             # Create final output with standardized schema
-            result = df.with_columns([
+            result = df.select([
                 pl.col('jobID').alias('Job Id'),
                 pl.col('node').alias('Host'),
                 pl.lit('nfs').alias('Event'),
+                rate.alias('Value'),
                 pl.lit('MB/s').alias('Units'),
                 pl.col('Timestamp_original').alias('Timestamp')
-            ]).select(['Job Id', 'Host', 'Event', 'Value', 'Units', 'Timestamp'])
+            ])
             
             logger.info(f"Processed NFS data: {len(result)} output rows")
             return result
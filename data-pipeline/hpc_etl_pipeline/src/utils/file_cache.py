@@ -0,0 +1,36 @@
+"""Page cache hints for large, read-once/write-once files."""
+
+import os
+from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def drop_page_cache(file_path: Path, written: bool = False) -> None:
+    """
+    Advise the kernel that the cached pages of a file are no longer needed.
+
+    Input CSVs are streamed once and output Parquet files are written once,
+    so keeping them in the page cache only evicts memory other processes
+    could use. The kernel only drops clean pages, so a freshly written file
+    is flushed to disk first. This is a no-op on platforms without
+    ``posix_fadvise``.
+
+    Args:
+        file_path: Path to the file whose cached pages should be released
+        written: Whether the file was just written and may still have dirty pages
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            if written:
+                os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.debug(f"Could not drop page cache for {file_path}: {e}")
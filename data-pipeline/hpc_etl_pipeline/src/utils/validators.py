@@ -3,6 +3,7 @@
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import polars as pl
+import pyarrow.parquet as pq
 import logging
 
 logger = logging.getLogger(__name__)
@@ -61,6 +62,10 @@ def validate_parquet_file(file_path: Path,
     """
     Validate that a Parquet file is properly written and readable.
     
+    Only the footer is read: the row count and column names come from the
+    file metadata and no data pages are decoded. A file with an intact
+    footer but corrupt data pages therefore still passes.
+    
     Args:
         file_path: Path to the Parquet file to validate
         expected_min_rows: Minimum number of rows expected
@@ -79,35 +84,25 @@ def validate_parquet_file(file_path: Path,
             logger.error(f"File is empty: {file_path}")
             return False
         
-        # Try to read the file
+        # Parse the footer once; it carries both the row count and the schema
         try:
-            # For large files, just check that we can read some rows
-            if expected_min_rows > 10000:
-                test_df = pl.read_parquet(file_path, n_rows=min(1000, expected_min_rows))
-                if test_df.is_empty():
-                    logger.error(f"File appears to be empty: {file_path}")
+            file_metadata = pq.read_metadata(file_path)
+            actual_rows = file_metadata.num_rows
+            if actual_rows == 0:
+                logger.error(f"File appears to be empty: {file_path}")
+                return False
+            
+            if actual_rows < expected_min_rows:
+                logger.error(f"File has {actual_rows} rows, expected at least {expected_min_rows}: {file_path}")
+                return False
+            
+            if required_columns:
+                missing_columns = set(required_columns) - set(file_metadata.schema.names)
+                if missing_columns:
+                    logger.error(f"Missing required columns in {file_path}: {missing_columns}")
                     return False
-                
-                # For very large files, don't read the entire file for row count
-                if expected_min_rows > 100000:
-                    logger.debug(f"Large file validation passed (sample check): {file_path}")
-                    return True
-                else:
-                    # Get the actual row count for medium-sized files
-                    try:
-                        actual_rows = len(pl.read_parquet(file_path))
-                        if actual_rows < expected_min_rows:
-                            logger.error(f"File has {actual_rows} rows, expected at least {expected_min_rows}: {file_path}")
-                            return False
-                    except Exception as e:
-                        logger.warning(f"Could not get exact row count for {file_path}: {e}")
-                        return len(test_df) >= min(100, expected_min_rows)
-            else:
-                # For smaller files, read and validate fully
-                test_df = pl.read_parquet(file_path)
-                return validate_dataframe(test_df, required_columns, expected_min_rows)
             
-            logger.debug(f"File validation passed: {file_path}")
+            logger.debug(f"File validation passed: {file_path} ({actual_rows} rows)")
             return True
             
         except Exception as e:
@@ -2,9 +2,13 @@
 
 import time
 import logging
+from fnmatch import fnmatchcase
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 
 from ..core.pipeline import Pipeline
@@ -18,15 +22,18 @@ class PipelineFileHandler(FileSystemEventHandler):
     def __init__(self, pipeline: Pipeline, 
                  wait_delay_seconds: int = 10,
                  max_move_attempts: int = 3,
-                 retry_delay_seconds: int = 3):
+                 retry_delay_seconds: int = 3,
+                 max_workers: int = 1):
         """
         Initialize file handler.
         
         Args:
-            pipeline: Pipeline instance to use for processing
+            pipeline: Pipeline whose configuration is used for processing and
+                whose counters collect the results
             wait_delay_seconds: Delay to wait for file writing to complete
             max_move_attempts: Maximum attempts to process a file
             retry_delay_seconds: Delay between retry attempts
+            max_workers: Maximum number of files processed concurrently
         """
         self.pipeline = pipeline
         self.wait_delay_seconds = wait_delay_seconds
@@ -36,6 +43,17 @@ class PipelineFileHandler(FileSystemEventHandler):
         # Get file patterns from pipeline configuration
         self.file_patterns = pipeline.config['source'].get('file_patterns', [])
         
+        # Files are handled off the observer thread so a slow file does not
+        # hold back events for the others
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers),
+                                            thread_name_prefix='pipeline-file')
+        self._pending: Dict[Path, threading.Event] = {}
+        self._lock = threading.Lock()
+        
+        # Pipeline instances keep per-file state and counters that are not
+        # safe to share, so every handler thread builds its own
+        self._thread_state = threading.local()
+        
     def on_created(self, event):
         """Handle file creation events."""
         if event.is_directory:
@@ -49,22 +67,101 @@ class PipelineFileHandler(FileSystemEventHandler):
             return
         
         logger.info(f"Detected new file: {file_path}")
+        self._schedule(file_path)
+    
+    def on_moved(self, event):
+        """Handle files renamed into place, which are complete once they appear."""
+        if event.is_directory:
+            return
+        
+        file_path = Path(event.dest_path)
+        if not self._matches_patterns(file_path):
+            logger.debug(f"Ignoring file (doesn't match patterns): {file_path}")
+            return
+        
+        # Writers that rename a finished temp file into place never close the
+        # final name, so there is nothing to wait for
+        logger.info(f"Detected file moved into place: {file_path}")
+        self._schedule(file_path, written=True)
+    
+    def on_closed(self, event):
+        """Handle close-after-write events, which mark a file as fully written."""
+        if event.is_directory:
+            return
         
-        # Wait for file writing to complete
-        if self.wait_delay_seconds > 0:
-            logger.info(f"Waiting {self.wait_delay_seconds} seconds for file writing to complete...")
-            time.sleep(self.wait_delay_seconds)
+        file_path = Path(event.src_path)
+        if not self._matches_patterns(file_path):
+            return
+        
+        # Only a file that is already waiting to be processed is affected.
+        # Opening and closing an existing file must not process it again
+        with self._lock:
+            written_event = self._pending.get(file_path)
+        
+        if written_event is not None:
+            logger.debug(f"File closed after writing: {file_path}")
+            written_event.set()
+    
+    def shutdown(self):
+        """Wait for files that are already scheduled to finish processing."""
+        self._executor.shutdown(wait=True)
+    
+    def _schedule(self, file_path: Path, written: bool = False):
+        """
+        Queue a file for processing unless it is already queued.
         
-        # Process the file with retry logic
-        self._process_file_with_retry(file_path)
+        Args:
+            file_path: File to process
+            written: Whether the file is already known to be fully written
+        """
+        with self._lock:
+            written_event = self._pending.get(file_path)
+            if written_event is None:
+                written_event = threading.Event()
+                self._pending[file_path] = written_event
+                if written:
+                    written_event.set()
+                self._executor.submit(self._handle_file, file_path, written_event)
+            elif written:
+                written_event.set()
+    
+    def _handle_file(self, file_path: Path, written_event: threading.Event):
+        """Wait for a file to be written, then process it."""
+        try:
+            # A close-after-write or rename event ends the wait early; the
+            # delay remains the fallback for platforms and filesystems that
+            # report neither
+            if not written_event.is_set() and self.wait_delay_seconds > 0:
+                logger.info(f"Waiting up to {self.wait_delay_seconds} seconds for file writing to complete...")
+                written_event.wait(self.wait_delay_seconds)
+            
+            # Process the file with retry logic. A writer may reopen the file
+            # after closing it, so the stability check still applies
+            self._process_file_with_retry(file_path)
+        except Exception as e:
+            logger.error(f"Unexpected error handling file {file_path}: {e}")
+        finally:
+            with self._lock:
+                self._pending.pop(file_path, None)
     
     def _matches_patterns(self, file_path: Path) -> bool:
         """Check if file matches configured patterns."""
         if not self.file_patterns:
             return True  # No patterns configured, accept all files
         
+        # Glob patterns are matched as globs, plain names by suffix, so
+        # "cpu.csv" accepts "2015-03_cpu.csv" but not temp files such as
+        # "cpu.csv.part" or rsync's ".cpu.csv.Ab12Cd"
         file_name = file_path.name.lower()
-        return any(pattern.lower() in file_name for pattern in self.file_patterns)
+        for pattern in self.file_patterns:
+            pattern = pattern.lower()
+            if any(char in pattern for char in '*?['):
+                if fnmatchcase(file_name, pattern):
+                    return True
+            elif file_name.endswith(pattern):
+                return True
+        
+        return False
     
     def _process_file_with_retry(self, file_path: Path):
         """Process file with retry logic."""
@@ -74,12 +171,12 @@ class PipelineFileHandler(FileSystemEventHandler):
                     logger.error(f"File no longer exists: {file_path}")
                     return
                 
-                # Check if file is still being written (size changing)
+                # Check if file is still being written (size or mtime changing)
                 if self._is_file_stable(file_path):
                     logger.info(f"Processing file (attempt {attempt + 1}): {file_path}")
                     
                     # Process through pipeline
-                    success = self.pipeline.process_file(str(file_path))
+                    success = self._run_pipeline(file_path)
                     
                     if success:
                         logger.info(f"Successfully processed: {file_path}")
@@ -101,13 +198,31 @@ class PipelineFileHandler(FileSystemEventHandler):
         
         logger.error(f"Failed to process file after {self.max_move_attempts} attempts: {file_path}")
     
+    def _run_pipeline(self, file_path: Path) -> bool:
+        """Process a file with this thread's pipeline and add its counts to the shared one."""
+        pipeline = getattr(self._thread_state, 'pipeline', None)
+        if pipeline is None:
+            pipeline = Pipeline(self.pipeline.config_path)
+            self._thread_state.pipeline = pipeline
+        
+        processed_before = pipeline.processed_files
+        failed_before = pipeline.failed_files
+        
+        success = pipeline.process_file(str(file_path))
+        
+        with self._lock:
+            self.pipeline.processed_files += pipeline.processed_files - processed_before
+            self.pipeline.failed_files += pipeline.failed_files - failed_before
+        
+        return success
+    
     def _is_file_stable(self, file_path: Path, stability_time: int = 2) -> bool:
-        """Check if file size is stable (not being actively written)."""
+        """Check if file size and mtime are stable (not being actively written)."""
         try:
-            initial_size = file_path.stat().st_size
+            initial_stat = file_path.stat()
             time.sleep(stability_time)
-            final_size = file_path.stat().st_size
-            return initial_size == final_size
+            final_stat = file_path.stat()
+            return (initial_stat.st_size, initial_stat.st_mtime_ns) == (final_stat.st_size, final_stat.st_mtime_ns)
         except Exception as e:
             logger.warning(f"Could not check file stability for {file_path}: {e}")
             return True  # Assume stable if we can't check
@@ -116,6 +231,12 @@ class PipelineFileHandler(FileSystemEventHandler):
 class FileWatcher:
     """File watcher for monitoring directories and triggering pipeline processing."""
     
+    # Shared filesystems where inotify does not see writes made by other
+    # hosts, such as a Globus endpoint writing into the watched directory
+    NETWORK_FILESYSTEMS = {
+        'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'lustre', 'gpfs', 'beegfs', 'fuse.sshfs'
+    }
+    
     def __init__(self, pipeline: Pipeline, watch_config: Optional[Dict[str, Any]] = None):
         """
         Initialize file watcher.
@@ -132,21 +253,70 @@ class FileWatcher:
         self.wait_delay_seconds = self.watch_config.get('wait_delay_seconds', 10)
         self.max_move_attempts = self.watch_config.get('max_move_attempts', 3)
         self.retry_delay_seconds = self.watch_config.get('retry_delay_seconds', 3)
+        # Concurrent files need the same disk and memory as batch mode workers
+        self.max_workers = min(self.watch_config.get('max_workers', 1),
+                               self.pipeline.get_file_workers())
+        self.force_polling = self.watch_config.get('force_polling', False)
+        self.polling_interval_seconds = self.watch_config.get('polling_interval_seconds', 5)
+        
+        # Ensure source directory exists
+        self.source_dir.mkdir(parents=True, exist_ok=True)
         
         # Create handler and observer
         self.event_handler = PipelineFileHandler(
             pipeline=self.pipeline,
             wait_delay_seconds=self.wait_delay_seconds,
             max_move_attempts=self.max_move_attempts,
-            retry_delay_seconds=self.retry_delay_seconds
+            retry_delay_seconds=self.retry_delay_seconds,
+            max_workers=self.max_workers
         )
-        self.observer = Observer()
-        
-        # Ensure source directory exists
-        self.source_dir.mkdir(parents=True, exist_ok=True)
+        self.observer = self._create_observer()
         
         logger.info(f"Initialized file watcher for directory: {self.source_dir}")
     
+    def _create_observer(self):
+        """Create a kernel event observer, or a polling one where events are unreliable."""
+        fs_type = self._get_filesystem_type(self.source_dir)
+        
+        if self.force_polling or fs_type in self.NETWORK_FILESYSTEMS:
+            logger.info(f"Polling {self.source_dir} every {self.polling_interval_seconds}s "
+                        f"(filesystem: {fs_type or 'unknown'})")
+            return PollingObserver(timeout=self.polling_interval_seconds)
+        
+        return Observer()
+    
+    def _get_filesystem_type(self, path: Path) -> Optional[str]:
+        """
+        Get the type of the filesystem a path is mounted on.
+        
+        Args:
+            path: Path to look up
+            
+        Returns:
+            Filesystem type from /proc/mounts, or None if it cannot be determined
+        """
+        try:
+            resolved = path.resolve()
+            best_mount, best_type = None, None
+            
+            with open('/proc/mounts') as f:
+                for line in f:
+                    fields = line.split()
+                    if len(fields) < 3:
+                        continue
+                    
+                    # The mount table escapes spaces in mount points as \040
+                    mount_point = Path(fields[1].replace('\\040', ' '))
+                    if mount_point == resolved or mount_point in resolved.parents:
+                        # The deepest mount point containing the path wins
+                        if best_mount is None or len(mount_point.parts) >= len(best_mount.parts):
+                            best_mount, best_type = mount_point, fields[2]
+            
+            return best_type
+            
+        except OSError:
+            return None
+    
     def start(self):
         """Start watching for file changes."""
         try:
@@ -159,10 +329,9 @@ class FileWatcher:
             self.observer.start()
             logger.info(f"Started file watcher on: {self.source_dir}")
             
-            # Keep the watcher running
+            # Block until the observer stops or the watcher is interrupted
             try:
-                while True:
-                    time.sleep(1)
+                self.observer.join()
                     
             except KeyboardInterrupt:
                 logger.info("Received interrupt signal, stopping file watcher...")
@@ -177,6 +346,7 @@ class FileWatcher:
         try:
             self.observer.stop()
             self.observer.join()
+            self.event_handler.shutdown()
             logger.info("File watcher stopped")
         except Exception as e:
             logger.error(f"Error stopping file watcher: {e}")